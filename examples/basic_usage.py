@@ -8,6 +8,12 @@ and perform basic analysis.
 
 from firefox_tab_extractor import FirefoxTabExtractor
 from datetime import datetime, timedelta
+from itertools import chain
+
+
+def _ell(text, limit):
+    """Truncate text to limit characters, appending an ellipsis if cut"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 
 def main():
@@ -45,40 +51,27 @@ def main():
         # Show domain statistics
         if stats["domains"]:
             print("\n🌐 Top domains:")
-            domain_counts = {}
-            for tab in tabs:
-                if tab.domain:
-                    domain_counts[tab.domain] = domain_counts.get(tab.domain, 0) + 1  # noqa: E501
-
-            sorted_domains = sorted(  # noqa: E501
-                domain_counts.items(), key=lambda x: x[1], reverse=True
-            )
-            for domain, count in sorted_domains[:5]:
+            for domain, count in stats["domains"].most_common(5):
                 print(f"   • {domain}: {count} tabs")
 
         # Show recent tabs (accessed in last 7 days)
         print("\n🕒 Recently accessed tabs (last 7 days):")
         week_ago = datetime.now() - timedelta(days=7)
-        recent_tabs = [
-            tab for tab in tabs if tab.last_accessed_datetime > week_ago
-        ]  # noqa: E501
+        cutoff_ms = int(week_ago.timestamp() * 1000)
+        recent_tabs = [tab for tab in tabs if tab.last_accessed > cutoff_ms]
 
         for i, tab in enumerate(recent_tabs[:5]):
-            title_preview = (
-                f"{tab.title[:50]}{'...' if len(tab.title) > 50 else ''}"  # noqa: E501
-            )
-            url_preview = f"{tab.url[:60]}{'...' if len(tab.url) > 60 else ''}"
-            print(f"   {i+1}. {title_preview}")
-            print(f"      {url_preview}")
+            print(f"   {i+1}. {_ell(tab.title, 50)}")
+            print(f"      {_ell(tab.url, 60)}")
 
         # Show pinned tabs
-        pinned_tabs = [tab for tab in tabs if tab.pinned]
+        pinned_tabs = list(
+            chain.from_iterable(window.pinned_tabs for window in windows)
+        )
         if pinned_tabs:
             print("\n📌 Pinned tabs:")
             for i, tab in enumerate(pinned_tabs):
-                print(
-                    f"   {i+1}. {tab.title[:50]}{'...' if len(tab.title) > 50 else ''}"  # noqa: E501
-                )
+                print(f"   {i+1}. {_ell(tab.title, 50)}")
 
         # Save to files
         print("\n💾 Saving to files...")
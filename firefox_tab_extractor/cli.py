@@ -3,7 +3,9 @@ Command-line interface for Firefox Tab Extractor
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 from .extractor import FirefoxTabExtractor
@@ -15,6 +17,22 @@ from .exceptions import (
 )
 
 
+def _ell(text: str, limit: int) -> str:
+    """Truncate text to limit characters, appending an ellipsis if cut"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _same_file(path_a: str, path_b: str) -> bool:
+    """Check whether two output paths refer to the same file"""
+    if os.path.realpath(path_a) == os.path.realpath(path_b):
+        return True
+    try:
+        # Catches hard links and case-insensitive filesystems
+        return os.path.samefile(path_a, path_b)
+    except OSError:  # at least one file doesn't exist yet
+        return False
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -93,44 +111,36 @@ Examples:
         # Get statistics
         stats = extractor.get_statistics(tabs)
 
-        # Display summary
-        print("\n📊 Summary:")
-        print("  • Total tabs: {stats['total_tabs']}")
-        print("  • Windows: {stats['total_windows']}")
-        print("  • Pinned tabs: {stats['pinned_tabs']}")
-        print("  • Hidden tabs: {stats['hidden_tabs']}")
-        print("  • Visible tabs: {stats['visible_tabs']}")
-
-        # Show preview
-        if args.preview > 0:
-            print("\n🔍 Preview of first {min(args.preview, len(tabs))} tabs:")
-            for i, tab in enumerate(tabs[: args.preview]):
-                print(
-                    f"  {i+1}. {tab.title[:60]}{'...' if len(tab.title) > 60 else ''}"  # noqa: E501
-                )
-                print(
-                    f"     URL: {tab.url[:80]}{'...' if len(tab.url) > 80 else ''}"  # noqa: E501
-                )
-                print(f"     Window: {tab.window_index}, Tab: {tab.tab_index}")
+        # Collect the report and emit it with a single write
+        out = [
+            "\n📊 Summary:",
+            f"  • Total tabs: {stats['total_tabs']}",
+            f"  • Windows: {stats['total_windows']}",
+            f"  • Pinned tabs: {stats['pinned_tabs']}",
+            f"  • Hidden tabs: {stats['hidden_tabs']}",
+            f"  • Visible tabs: {stats['visible_tabs']}",
+        ]
+
+        # Show preview (skipped when only statistics were requested)
+        if args.preview > 0 and not args.stats_only:
+            shown = tabs[: args.preview]
+            out.append(f"\n🔍 Preview of first {len(shown)} tabs:")
+            for i, tab in enumerate(shown):
+                location = f"Window: {tab.window_index}, Tab: {tab.tab_index}"
+                out.append(f"  {i+1}. {_ell(tab.title, 60)}")
+                out.append(f"     URL: {_ell(tab.url, 80)}")
+                out.append(f"     {location}")
                 if tab.pinned:
-                    print("     📌 Pinned")
-                print()
+                    out.append("     📌 Pinned")
+                out.append("")
 
         # Show domain statistics
         if stats["domains"]:
-            print("🌐 Top domains:")
-            domain_counts = {}
-            for tab in tabs:
-                if tab.domain:
-                    domain_counts[tab.domain] = (
-                        domain_counts.get(tab.domain, 0) + 1
-                    )  # noqa: E501
-
-            sorted_domains = sorted(
-                domain_counts.items(), key=lambda x: x[1], reverse=True
-            )
-            for domain, count in sorted_domains[:5]:
-                print(f"  • {domain}: {count} tabs")
+            out.append("🌐 Top domains:")
+            for domain, count in stats["domains"].most_common(5):
+                out.append(f"  • {domain}: {count} tabs")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
         if args.stats_only:
             return
@@ -147,13 +157,29 @@ Examples:
         # Save files
         print("\n💾 Saving files...")
 
-        if args.json:
-            extractor.save_to_json(tabs, args.json)
-            print(f"  ✅ JSON: {args.json}")
-
-        if args.csv:
-            extractor.save_to_csv(tabs, args.csv)
-            print(f"  ✅ CSV: {args.csv}")
+        # The two exports are independent, so overlap their file writes.
+        # If both point at the same file, a single worker keeps them
+        # sequential (JSON first, then CSV) instead of interleaving bytes.
+        same_file = _same_file(args.json, args.csv)
+        with ThreadPoolExecutor(max_workers=1 if same_file else 2) as executor:
+            json_job = executor.submit(extractor.save_to_json, tabs, args.json)
+            csv_job = executor.submit(extractor.save_to_csv, tabs, args.csv)
+
+        # Report each export on its own, since one can fail independently
+        failed = False
+        for label, path, job in (
+            ("JSON", args.json, json_job),
+            ("CSV", args.csv, csv_job),
+        ):
+            error = job.exception()
+            if error is None:
+                print(f"  ✅ {label}: {path}")
+            else:
+                print(f"  ❌ {label}: {path} ({error})")
+                failed = True
+
+        if failed:
+            sys.exit(1)
 
         print("\n🎉 Extraction completed successfully!")
         print("📁 Files created:")
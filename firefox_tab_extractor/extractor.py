@@ -5,12 +5,27 @@ Main Firefox Tab Extractor class
 import json
 import csv
 import os
-import glob
+import time
 import lz4.block
 
 from datetime import datetime
 from typing import List, Optional, Tuple, Dict, Any
 import logging
+from collections import Counter
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+
+try:
+    import simdjson
+
+    _HAS_SIMDJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_SIMDJSON = False
 
 from .models import Tab, Window
 from .exceptions import (
@@ -21,6 +36,19 @@ from .exceptions import (
 )
 
 
+def _format_timestamp(timestamp_ms: int) -> str:
+    """Format a millisecond Unix timestamp as local 'YYYY-MM-DD HH:MM:SS'"""
+    t = time.localtime(timestamp_ms / 1000)
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (
+        t.tm_year,
+        t.tm_mon,
+        t.tm_mday,
+        t.tm_hour,
+        t.tm_min,
+        t.tm_sec,
+    )
+
+
 class FirefoxTabExtractor:
     """
     Main class for extracting Firefox browser tabs
@@ -87,22 +115,20 @@ class FirefoxTabExtractor:
             if os.path.exists(base_path):
                 self.logger.debug("Checking base path: {base_path}")
 
-                # Look for profile directories
-                profiles = glob.glob(os.path.join(base_path, "*.default*"))
-                if not profiles:
-                    profiles = [
-                        d
-                        for d in os.listdir(base_path)
-                        if os.path.isdir(os.path.join(base_path, d))
-                        and not d.startswith(".")
-                    ]
-
-                for profile in profiles:
-                    profile_path = (
-                        os.path.join(base_path, profile)
-                        if isinstance(profile, str)
-                        else profile
-                    )
+                # Look for profile directories in a single directory scan,
+                # preferring *.default* profiles over any other directory
+                default_profiles = []
+                other_profiles = []
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(".") or not entry.is_dir():
+                            continue
+                        if ".default" in entry.name:
+                            default_profiles.append(entry.path)
+                        else:
+                            other_profiles.append(entry.path)
+
+                for profile_path in default_profiles or other_profiles:
                     recovery_file = os.path.join(
                         profile_path,
                         "sessionstore-backups",
@@ -130,13 +156,19 @@ class FirefoxTabExtractor:
         """
         try:
             with open(file_path, "rb") as f:
-                # Skip the first 8 bytes (magic number)
+                # Skip the first 8 bytes (magic number), then read the
+                # little-endian uncompressed size stored by mozLz4
                 f.read(8)
+                size = int.from_bytes(f.read(4), "little")
                 compressed_data = f.read()
 
-            # Decompress the data
-            decompressed = lz4.block.decompress(compressed_data)
-            return json.loads(decompressed.decode("utf-8"))
+            # Same as lz4.block.decompress's default size-prefix handling,
+            # with the header read spelled out
+            raw = lz4.block.decompress(compressed_data, uncompressed_size=size)
+            # Release the compressed copy before parsing
+            del compressed_data
+            session_data: Dict[str, Any] = self._parse_session_json(raw)
+            return session_data
 
         except Exception:  # noqa: F841
             self.logger.error("Error decompressing file: {e}")
@@ -144,6 +176,36 @@ class FirefoxTabExtractor:
                 "Failed to decompress {file_path}: {e}"
             )  # noqa: E501
 
+    def _parse_session_json(self, data: bytes) -> Any:
+        """
+        Parse decompressed session JSON with the fastest available parser
+
+        Prefers simdjson (lazy document access), then orjson, then the
+        standard library json module. The fast parsers reject some input
+        Firefox writes (e.g. a lone surrogate escape left in a title cut
+        mid-emoji), so anything they refuse falls through to json.loads.
+
+        Args:
+            data: Raw UTF-8 encoded JSON bytes
+
+        Returns:
+            Parsed session data
+        """
+        if _HAS_SIMDJSON:
+            try:
+                # The returned document keeps its parser alive by itself
+                return simdjson.Parser().parse(data)
+            except ValueError:
+                pass
+
+        if _HAS_ORJSON:
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                pass
+
+        return json.loads(data.decode("utf-8"))
+
     def _extract_tabs_from_session(
         self, session_data: Dict[str, Any]
     ) -> List[Tab]:  # noqa: E501
@@ -162,42 +224,44 @@ class FirefoxTabExtractor:
             self.logger.warning("No windows found in session data")
             return tabs
 
-        for window_idx, window in enumerate(session_data["windows"]):
+        append = tabs.append
+        for window_index, window in enumerate(session_data["windows"], 1):
             if "tabs" not in window:
                 continue
 
-            for tab_idx, tab in enumerate(window["tabs"]):
-                if "entries" not in tab or not tab["entries"]:
+            for tab_index, tab in enumerate(window["tabs"], 1):
+                entries = tab.get("entries")
+                if not entries:
                     continue
 
                 # Get the current entry (active page in tab)
                 current_entry_idx = (
                     tab.get("index", 1) - 1
                 )  # Firefox uses 1-based indexing
-                if current_entry_idx >= len(tab["entries"]):
-                    current_entry_idx = len(tab["entries"]) - 1
-
-                entry = tab["entries"][current_entry_idx]
-
-                tab_obj = Tab(
-                    window_index=window_idx + 1,
-                    tab_index=tab_idx + 1,
-                    title=entry.get("title", "Untitled"),
-                    url=entry.get("url", ""),
-                    last_accessed=tab.get("lastAccessed", 0),
-                    last_accessed_readable=(
-                        datetime.fromtimestamp(
-                            tab.get("lastAccessed", 0) / 1000
-                        ).strftime("%Y-%m-%d %H:%M:%S")
-                        if tab.get("lastAccessed")
-                        else "Unknown"
-                    ),
-                    pinned=tab.get("pinned", False),
-                    hidden=tab.get("hidden", False),
+                if current_entry_idx >= len(entries):
+                    current_entry_idx = len(entries) - 1
+
+                entry = entries[current_entry_idx]
+                last_accessed = tab.get("lastAccessed", 0)
+
+                # Positional arguments skip keyword matching in __init__
+                append(
+                    Tab(
+                        window_index,
+                        tab_index,
+                        entry.get("title", "Untitled"),
+                        entry.get("url", ""),
+                        last_accessed,
+                        (
+                            _format_timestamp(last_accessed)
+                            if last_accessed
+                            else "Unknown"
+                        ),
+                        tab.get("pinned", False),
+                        tab.get("hidden", False),
+                    )
                 )
 
-                tabs.append(tab_obj)
-
         return tabs
 
     def extract_tabs(self) -> List[Tab]:
@@ -240,18 +304,15 @@ class FirefoxTabExtractor:
         Returns:
             List of Window objects
         """
-        windows_dict = {}
+        buckets: Dict[int, List[Tab]] = {}
 
         for tab in tabs:
-            if tab.window_index not in windows_dict:
-                windows_dict[tab.window_index] = []
-            windows_dict[tab.window_index].append(tab)
-
-        windows = []
-        for window_index, window_tabs in sorted(windows_dict.items()):
-            windows.append(Window(window_index=window_index, tabs=window_tabs))
+            buckets.setdefault(tab.window_index, []).append(tab)
 
-        return windows
+        return [
+            Window(window_index=window_index, tabs=buckets[window_index])
+            for window_index in sorted(buckets)
+        ]
 
     def save_to_json(self, tabs: List[Tab], output_path: str) -> None:
         """
@@ -270,8 +331,12 @@ class FirefoxTabExtractor:
             "tabs": [tab.to_dict() for tab in tabs],
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if _HAS_ORJSON:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
         self.logger.info("Saved {len(tabs)} tabs to {output_path}")
 
@@ -286,7 +351,7 @@ class FirefoxTabExtractor:
         if not tabs:
             return
 
-        fieldnames = [
+        header = (
             "window_index",
             "tab_index",
             "title",
@@ -295,17 +360,25 @@ class FirefoxTabExtractor:
             "pinned",
             "hidden",
             "domain",
+        )
+        rows = [
+            (
+                tab.window_index,
+                tab.tab_index,
+                tab.title,
+                tab.url,
+                tab.last_accessed_readable,
+                tab.pinned,
+                tab.hidden,
+                tab.domain,
+            )
+            for tab in tabs
         ]
 
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for tab in tabs:
-                csv_row = {
-                    field: tab.to_dict().get(field, "") for field in fieldnames
-                }  # noqa: E501
-                writer.writerow(csv_row)
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
 
         self.logger.info("Saved {len(tabs)} tabs to {output_path}")
 
@@ -317,16 +390,30 @@ class FirefoxTabExtractor:
             tabs: List of Tab objects
 
         Returns:
-            Dictionary with statistics
+            Dictionary with statistics. ``domains`` is a Counter mapping
+            each domain to its tab count, so ``most_common(n)`` gives the
+            top domains.
         """
         windows = self.get_windows(tabs)
 
+        pinned = hidden = 0
+        domains: Counter = Counter()
+        for tab in tabs:
+            if tab.pinned:
+                pinned += 1
+            if tab.hidden:
+                hidden += 1
+            domain = tab.domain
+            if domain:
+                domains[domain] += 1
+
+        total = len(tabs)
         return {
-            "total_tabs": len(tabs),
+            "total_tabs": total,
             "total_windows": len(windows),
-            "pinned_tabs": sum(1 for tab in tabs if tab.pinned),
-            "hidden_tabs": sum(1 for tab in tabs if tab.hidden),
-            "visible_tabs": sum(1 for tab in tabs if not tab.hidden),
+            "pinned_tabs": pinned,
+            "hidden_tabs": hidden,
+            "visible_tabs": total - hidden,
             "windows": [window.to_dict() for window in windows],
-            "domains": list(set(tab.domain for tab in tabs if tab.domain)),
+            "domains": domains,
         }
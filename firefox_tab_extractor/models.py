@@ -4,13 +4,43 @@ Data models for Firefox Tab Extractor
 
 from dataclasses import dataclass
 from datetime import datetime
+from string import ascii_letters, digits
 from typing import List
 
+_SCHEME_CHARS = ascii_letters + digits + "+-."
+
+
+def _netloc(url: str) -> str:
+    """
+    Extract the network location from a URL
+
+    Equivalent to ``urlparse(url).netloc`` for browser URLs, without the
+    cost of a full RFC 3986 parse.
+    """
+    scheme, sep, rest = url.partition(":")
+    # Only "scheme://" introduces a netloc, e.g. not "about:reader?url=..."
+    if not sep or rest[:2] != "//":
+        return ""
+    if not scheme or scheme.strip(_SCHEME_CHARS):
+        return ""
+    return rest[2:].partition("/")[0].partition("?")[0].partition("#")[0]
+
 
 @dataclass
 class Tab:
     """Represents a Firefox tab with all its metadata"""
 
+    __slots__ = (
+        "window_index",
+        "tab_index",
+        "title",
+        "url",
+        "last_accessed",
+        "last_accessed_readable",
+        "pinned",
+        "hidden",
+    )
+
     window_index: int
     tab_index: int
     title: str
@@ -28,13 +58,7 @@ class Tab:
     @property
     def domain(self) -> str:
         """Extract domain from URL"""
-        from urllib.parse import urlparse
-
-        try:
-            parsed = urlparse(self.url)
-            return parsed.netloc
-        except Exception:
-            return ""
+        return _netloc(self.url)
 
     def to_dict(self) -> dict:
         """Convert tab to dictionary"""
@@ -55,6 +79,8 @@ class Tab:
 class Window:
     """Represents a Firefox window with its tabs"""
 
+    __slots__ = ("window_index", "tabs")
+
     window_index: int
     tabs: List[Tab]
 
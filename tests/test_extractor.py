@@ -6,9 +6,13 @@ import pytest
 import tempfile
 import os
 from unittest.mock import patch
+import csv
 import json
+import lz4.block
+from datetime import datetime
 
 from firefox_tab_extractor import FirefoxTabExtractor
+from firefox_tab_extractor import cli
 from firefox_tab_extractor.models import Tab, Window
 
 
@@ -51,6 +55,22 @@ class TestTab:
 
         assert tab.domain == "github.com"
 
+    def test_tab_domain_extraction_edge_cases(self):
+        """Test domain extraction matches urlparse netloc semantics"""
+        urls = {
+            "http://localhost:8080/path?q=1#top": "localhost:8080",
+            "https://example.com?q=1": "example.com",
+            "https://example.com#section": "example.com",
+            "about:reader?url=https://example.com/": "",
+            "about:blank": "",
+            "file:///home/user/notes.html": "",
+            "": "",
+        }
+
+        for url, expected in urls.items():
+            tab = Tab(1, 1, "Test", url, 0, "", False, False)
+            assert tab.domain == expected, url
+
     def test_tab_to_dict(self):
         """Test converting tab to dictionary"""
         tab = Tab(
@@ -71,6 +91,12 @@ class TestTab:
         assert tab_dict["pinned"] is True
         assert tab_dict["domain"] == "example.com"
 
+    def test_tab_uses_slots(self):
+        """Test that Tab instances don't carry a per-instance __dict__"""
+        tab = Tab(1, 1, "Test", "https://example.com", 0, "", False, False)
+
+        assert not hasattr(tab, "__dict__")
+
 
 class TestWindow:
     """Test Window model"""
@@ -104,6 +130,30 @@ class TestWindow:
         assert window_dict["pinned_tab_count"] == 1
         assert window_dict["visible_tab_count"] == 2
 
+    def test_window_tab_filters_follow_mutation(self):
+        """Test pinned/visible tabs reflect changes to the window's tabs"""
+        window = Window(
+            window_index=1,
+            tabs=[Tab(1, 1, "Tab 1", "https://a.com", 0, "", False, False)],
+        )
+
+        pinned_hidden = Tab(1, 2, "Tab 2", "https://b.com", 0, "", True, True)
+        window.tabs.append(pinned_hidden)
+
+        assert window.tab_count == 2
+        assert len(window.pinned_tabs) == 1
+        assert len(window.visible_tabs) == 1
+        assert window.to_dict()["pinned_tab_count"] == 1
+
+        # Modifying a returned list must not change the window
+        window.pinned_tabs.clear()
+        assert len(window.pinned_tabs) == 1
+
+        window.tabs = []
+
+        assert window.pinned_tabs == []
+        assert window.visible_tabs == []
+
 
 class TestFirefoxTabExtractor:
     """Test FirefoxTabExtractor class"""
@@ -116,12 +166,28 @@ class TestFirefoxTabExtractor:
         assert extractor.profile_path is None
         assert extractor.recovery_file is None
 
-    @pytest.mark.skip(reason="Complex mocking required - skipping for now")
     def test_find_firefox_profile_success(self):
         """Test successful Firefox profile detection"""
-        # This test requires complex mocking of the file system
-        # Skipping for now to focus on core functionality
-        pass
+        with tempfile.TemporaryDirectory() as home:
+            firefox_dir = os.path.join(home, ".mozilla", "firefox")
+            os.makedirs(os.path.join(firefox_dir, "other"))
+            backups = os.path.join(
+                firefox_dir, "abc123.default-release", "sessionstore-backups"
+            )
+            os.makedirs(backups)
+            expected_recovery = os.path.join(backups, "recovery.jsonlz4")
+            open(expected_recovery, "wb").close()
+
+            with patch(
+                "firefox_tab_extractor.extractor.os.path.expanduser",
+                side_effect=lambda path: path.replace("~", home, 1),
+            ):
+                extractor = FirefoxTabExtractor()
+
+            assert extractor.profile_path == os.path.join(
+                firefox_dir, "abc123.default-release"
+            )
+            assert extractor.recovery_file == expected_recovery
 
     @patch("firefox_tab_extractor.extractor.os.path.exists")
     def test_find_firefox_profile_not_found(self, mock_exists):
@@ -166,6 +232,110 @@ class TestFirefoxTabExtractor:
         assert len(tabs) == 1
         assert tabs[0].title == "Test Tab"
         assert tabs[0].url == "https://example.com"
+        assert tabs[0].last_accessed_readable == datetime.fromtimestamp(
+            1705312200
+        ).strftime("%Y-%m-%d %H:%M:%S")
+
+    @patch("firefox_tab_extractor.extractor.os.path.exists")
+    def test_decompress_lz4_file(self, mock_exists):
+        """Test reading a mozLz4-compressed session file"""
+        mock_exists.return_value = False  # No Firefox profile found
+
+        payload = json.dumps({"windows": [{"tabs": []}]}).encode("utf-8")
+
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".jsonlz4", delete=False
+        ) as f:  # noqa: E501
+            f.write(b"mozLz40\0" + lz4.block.compress(payload))
+            temp_file = f.name
+
+        try:
+            extractor = FirefoxTabExtractor()
+            session_data = extractor._decompress_lz4_file(temp_file)
+
+            assert "windows" in session_data
+            assert len(session_data["windows"]) == 1
+
+        finally:
+            os.unlink(temp_file)
+
+    @patch("firefox_tab_extractor.extractor.os.path.exists")
+    def test_decompress_lz4_file_lone_surrogate(self, mock_exists):
+        """Test a title with a lone surrogate escape is still extracted"""
+        mock_exists.return_value = False  # No Firefox profile found
+
+        # Firefox's JSON.stringify leaves "\ud83d" when a title is cut
+        # in the middle of an emoji
+        session = {
+            "windows": [
+                {
+                    "tabs": [
+                        {
+                            "index": 1,
+                            "entries": [
+                                {
+                                    "title": "bad \ud83d end",
+                                    "url": "https://example.com",
+                                }
+                            ],
+                        }
+                    ]
+                }
+            ]
+        }
+        payload = json.dumps(session).encode("utf-8")
+        assert b"\\ud83d" in payload
+
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".jsonlz4", delete=False
+        ) as f:  # noqa: E501
+            f.write(b"mozLz40\0" + lz4.block.compress(payload))
+            temp_file = f.name
+
+        try:
+            extractor = FirefoxTabExtractor()
+            session_data = extractor._decompress_lz4_file(temp_file)
+            tabs = extractor._extract_tabs_from_session(session_data)
+
+            assert len(tabs) == 1
+            assert tabs[0].title == "bad \ud83d end"
+
+        finally:
+            os.unlink(temp_file)
+
+    @patch("firefox_tab_extractor.extractor._HAS_SIMDJSON", False)
+    @patch("firefox_tab_extractor.extractor.os.path.exists")
+    def test_parse_session_json_without_simdjson(self, mock_exists):
+        """Test the orjson (or stdlib) fallback for session parsing"""
+        mock_exists.return_value = False  # No Firefox profile found
+
+        payload = b'{"windows": [{"tabs": [{"entries": [{"title": "T"}]}]}]}'
+
+        extractor = FirefoxTabExtractor()
+        session_data = extractor._parse_session_json(payload)
+
+        assert isinstance(session_data, dict)
+        entry = session_data["windows"][0]["tabs"][0]["entries"][0]
+        assert entry == {"title": "T"}
+
+    @patch("firefox_tab_extractor.extractor._HAS_ORJSON", False)
+    @patch("firefox_tab_extractor.extractor._HAS_SIMDJSON", False)
+    @patch("firefox_tab_extractor.extractor.os.path.exists")
+    def test_parse_session_json_stdlib_only(self, mock_exists):
+        """Test the stdlib json fallback for session parsing"""
+        mock_exists.return_value = False  # No Firefox profile found
+
+        payload = b'{"windows": [{"tabs": [{"entries": [{"title": "T"}]}]}]}'
+
+        extractor = FirefoxTabExtractor()
+        with patch(
+            "firefox_tab_extractor.extractor.json.loads", wraps=json.loads
+        ) as mock_loads:
+            session_data = extractor._parse_session_json(payload)
+
+        mock_loads.assert_called_once()
+        entry = session_data["windows"][0]["tabs"][0]["entries"][0]
+        assert entry == {"title": "T"}
 
     @patch("firefox_tab_extractor.extractor.os.path.exists")
     def test_get_windows(self, mock_exists):
@@ -206,6 +376,7 @@ class TestFirefoxTabExtractor:
         assert stats["pinned_tabs"] == 1
         assert stats["hidden_tabs"] == 1
         assert stats["visible_tabs"] == 2
+        assert stats["domains"]["example1.com"] == 1
 
     def test_save_to_json(self):
         """Test saving tabs to JSON file"""
@@ -226,7 +397,7 @@ class TestFirefoxTabExtractor:
             # Verify file was created and contains expected data
             assert os.path.exists(temp_file)
 
-            with open(temp_file, "r") as f:
+            with open(temp_file, "rb") as f:
                 data = json.loads(f.read())
 
             assert data["total_tabs"] == 1
@@ -236,6 +407,35 @@ class TestFirefoxTabExtractor:
         finally:
             os.unlink(temp_file)
 
+    @patch("firefox_tab_extractor.extractor._HAS_ORJSON", False)
+    def test_save_to_json_stdlib(self):
+        """Test saving tabs to JSON file without orjson"""
+        tabs = [
+            Tab(1, 1, "Tést Tab", "https://example.com", 0, "", False, False),
+        ]
+
+        extractor = FirefoxTabExtractor()
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        ) as f:  # noqa: E501
+            temp_file = f.name
+
+        try:
+            extractor.save_to_json(tabs, temp_file)
+
+            with open(temp_file, "r", encoding="utf-8") as f:
+                content = f.read()
+
+            # The stdlib path keeps non-ASCII characters unescaped
+            assert "Tést Tab" in content
+            data = json.loads(content)
+            assert data["total_tabs"] == 1
+            assert data["tabs"][0]["title"] == "Tést Tab"
+
+        finally:
+            os.unlink(temp_file)
+
     def test_save_to_csv(self):
         """Test saving tabs to CSV file"""
         tabs = [
@@ -265,5 +465,134 @@ class TestFirefoxTabExtractor:
             os.unlink(temp_file)
 
 
+class TestCLI:
+    """Test the command-line interface"""
+
+    TABS = [
+        Tab(1, 1, "Tab 1", "https://github.com/a", 0, "", True, False),
+        Tab(1, 2, "Tab 2", "https://github.com/b", 0, "", False, False),
+        Tab(2, 1, "Tab 3", "https://example.com", 0, "", False, True),
+    ]
+
+    def run_cli(self, *argv):
+        """Run cli.main() with the given arguments and canned tabs"""
+        with patch(
+            "firefox_tab_extractor.extractor.os.path.exists",
+            return_value=False,
+        ), patch.object(
+            FirefoxTabExtractor, "extract_tabs", return_value=self.TABS
+        ), patch(
+            "sys.argv", ["firefox-tab-extractor", *argv]
+        ):
+            cli.main()
+
+    def test_cli_summary_and_preview(self, capsys):
+        """Test the summary shows real counts and the preview is printed"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "tabs.json")
+            csv_path = os.path.join(tmp_dir, "tabs.csv")
+
+            self.run_cli("--json", json_path, "--csv", csv_path)
+
+            assert os.path.exists(json_path)
+            assert os.path.exists(csv_path)
+
+        out = capsys.readouterr().out
+
+        assert "{stats" not in out
+        assert "  • Total tabs: 3" in out
+        assert "  • Windows: 2" in out
+        assert "  • Pinned tabs: 1" in out
+        assert "  • Hidden tabs: 1" in out
+        assert "  • Visible tabs: 2" in out
+        assert "Preview of first 3 tabs:" in out
+        assert "  1. Tab 1" in out
+        assert "  • github.com: 2 tabs" in out
+        assert "Saving files" in out
+
+    def test_cli_same_output_path(self):
+        """Test --json and --csv pointing at one file leave a valid CSV"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "out")
+
+            self.run_cli("--json", out_path, "--csv", out_path)
+
+            with open(out_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+
+        assert rows[0][:4] == ["window_index", "tab_index", "title", "url"]
+        assert len(rows) == len(self.TABS) + 1
+
+    def test_cli_symlinked_output_path(self):
+        """Test a symlink between --json and --csv is treated as one file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "out.csv")
+            json_path = os.path.join(tmp_dir, "out.json")
+            open(csv_path, "w").close()
+            os.symlink(csv_path, json_path)
+
+            self.run_cli("--json", json_path, "--csv", csv_path)
+
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+
+        assert rows[0][:4] == ["window_index", "tab_index", "title", "url"]
+        assert len(rows) == len(self.TABS) + 1
+
+    def test_cli_hard_linked_output_path(self):
+        """Test a hard link between --json and --csv is treated as one file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "out.csv")
+            json_path = os.path.join(tmp_dir, "out.json")
+            open(csv_path, "w").close()
+            os.link(csv_path, json_path)
+
+            with patch(
+                "firefox_tab_extractor.cli.ThreadPoolExecutor",
+                wraps=cli.ThreadPoolExecutor,
+            ) as mock_executor:
+                self.run_cli("--json", json_path, "--csv", csv_path)
+
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+
+        mock_executor.assert_called_once_with(max_workers=1)
+        assert len(rows) == len(self.TABS) + 1
+
+    def test_cli_reports_failed_export(self, capsys):
+        """Test a failing JSON export is reported while CSV still succeeds"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "tabs.csv")
+            json_path = os.path.join(tmp_dir, "tabs.json")
+
+            with patch.object(
+                FirefoxTabExtractor,
+                "save_to_json",
+                side_effect=OSError("disk full"),
+            ), pytest.raises(SystemExit) as exc_info:
+                self.run_cli("--json", json_path, "--csv", csv_path)
+
+            assert os.path.getsize(csv_path) > 0
+
+        out = capsys.readouterr().out
+
+        assert exc_info.value.code == 1
+        assert f"  ❌ JSON: {json_path} (disk full)" in out
+        assert f"  ✅ CSV: {csv_path}" in out
+        assert "Extraction completed successfully" not in out
+
+    def test_cli_stats_only(self, capsys):
+        """Test --stats-only prints statistics but no preview or files"""
+        self.run_cli("--stats-only")
+
+        out = capsys.readouterr().out
+
+        assert "  • Total tabs: 3" in out
+        assert "  • github.com: 2 tabs" in out
+        assert "Preview" not in out
+        assert "Tab 1" not in out
+        assert "Saving files" not in out
+
+
 if __name__ == "__main__":
     pytest.main([__file__])